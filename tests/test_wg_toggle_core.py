@@ -0,0 +1,55 @@
+import io
+import time
+
+import pytest
+
+pytest.importorskip("PyQt5")
+
+from wg_toggle_core import iter_output_batches
+
+
+class ChunkedStream:
+    """Binary stream whose read1 returns the given chunks one at a time."""
+
+    def __init__(self, chunks):
+        self.chunks = list(chunks)
+
+    def read1(self, size=-1):
+        return self.chunks.pop(0) if self.chunks else b""
+
+
+def output_lines(stream):
+    return [line for batch in iter_output_batches(stream) for line in batch]
+
+
+def test_crlf_and_lone_cr():
+    stream = io.BytesIO(b"  one \r\ntwo\rprogress 10%\rprogress 20%\n\n")
+    assert output_lines(stream) == [
+        b"one", b"two", b"progress 10%", b"progress 20%",
+    ]
+
+
+def test_lines_split_across_chunks():
+    stream = ChunkedStream([b"[#] ip li", b"nk add\r", b"\nlast"])
+    assert output_lines(stream) == [b"[#] ip link add", b"last"]
+
+
+def test_ansi_only_lines_are_dropped():
+    stream = io.BytesIO(b"\x1b[0m\n\x1b[31m  red \x1b[0m\n\x1b[2K\r")
+    assert output_lines(stream) == [b"red"]
+
+
+def test_long_unterminated_line_is_linear():
+    data = b"x" * 200_000
+    stream = ChunkedStream([data[i:i + 4096] for i in range(0, len(data), 4096)])
+    start = time.monotonic()
+    assert output_lines(stream) == [data]
+    assert time.monotonic() - start < 1.0
+
+
+def test_each_read_is_yielded_before_the_next():
+    stream = ChunkedStream([b"[#] one\n[#] two\n", b"three\n"])
+    batches = iter_output_batches(stream)
+    assert next(batches) == [b"[#] one", b"[#] two"]
+    assert stream.chunks == [b"three\n"]
+    assert next(batches) == [b"three"]
@@ -0,0 +1,304 @@
+import re
+import subprocess
+from functools import partial
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QTextEdit
+from PyQt5.QtCore import Qt, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+from PyQt5.QtGui import QColor, QFont, QTextCharFormat, QTextCursor
+
+
+# ─── Strip ANSI escape codes ──────────────────────────────────────────────────
+# Output is handled as raw bytes until a line is ready to be shown.
+ANSI_ESCAPE = re.compile(rb'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+
+def strip_ansi(data):
+    # Most lines carry no escape codes at all; skip the regex for those.
+    if b'\x1b' not in data:
+        return data
+    return ANSI_ESCAPE.sub(b'', data)
+
+
+# ─── Split raw output into clean lines ────────────────────────────────────────
+# Splits on "\r" as well as "\n" so progress updates become separate lines.
+# Only the part up to the last line break is split; the unterminated tail is
+# carried over untouched, so each byte is scanned a bounded number of times.
+_LINE_SPLIT = re.compile(rb'[\r\n]+')
+READ_CHUNK  = 4096
+
+def iter_output_batches(stream):
+    """Yield lists of the non-empty, ANSI-free lines of a binary ``stream``.
+
+    There is one list per read, so the caller can hand them on
+    before the next read blocks on a quiet pipe.
+    """
+    pending = []   # chunks of the current unterminated line
+    while True:
+        chunk = stream.read1(READ_CHUNK)
+        if not chunk:
+            break
+        end = max(chunk.rfind(b"\n"), chunk.rfind(b"\r"))
+        if end < 0:
+            pending.append(chunk)
+            continue
+        pending.append(chunk[:end])
+        data = b"".join(pending)
+        pending = [chunk[end + 1:]]
+        lines = []
+        for line in _LINE_SPLIT.split(data):
+            line = strip_ansi(line).strip()
+            if line:
+                lines.append(line)
+        if lines:
+            yield lines
+
+    # flush any remaining content
+    line = strip_ansi(b"".join(pending)).strip()
+    if line:
+        yield [line]
+
+
+# ─── Log line coloring ────────────────────────────────────────────────────────
+LINE_DEFAULT, LINE_CMD, LINE_ERR, LINE_HEADER = range(4)
+
+# One pass classifies a line: a leading "[#]" always matches at position 0,
+# so it wins over any error word later in the same line.
+_CMD_PREFIX  = b"[#]"
+_CLASSIFY_RE = re.compile(rb'^\[#\]|error|failed|fatal', re.IGNORECASE)
+
+def classify_line(line):
+    """Return the LINE_* kind for a raw output line."""
+    m = _CLASSIFY_RE.search(line)
+    if m is None:
+        return LINE_DEFAULT
+    if m.group() == _CMD_PREFIX:
+        return LINE_CMD
+    return LINE_ERR
+
+def _char_format(color):
+    fmt = QTextCharFormat()
+    fmt.setForeground(QColor(color))
+    return fmt
+
+# Lines are inserted as plain text with one of these formats, which keeps
+# Qt's HTML parser out of the logging path.
+_LINE_FORMATS = {
+    LINE_DEFAULT: _char_format("#d4d4d4"),
+    LINE_CMD:     _char_format("#4ec9b0"),
+    LINE_ERR:     _char_format("#f44747"),
+    LINE_HEADER:  _char_format("#569cd6"),
+}
+
+
+# ─── Fonts and stylesheets ────────────────────────────────────────────────────
+# Built once at import so windows and status updates reuse the same objects.
+_TITLE_FONT = QFont()
+_TITLE_FONT.setPointSize(11)
+_TITLE_FONT.setBold(True)
+
+_LOG_FONT = QFont("Monospace", 9)
+
+_STATUS_QSS = "font-size: 12px; color: %s; border-top: 1px solid #444444; padding-top: 5px;"
+_STATUS_IDLE_QSS = _STATUS_QSS % "#888888"
+_STATUS_OK_QSS   = _STATUS_QSS % "#27ae60"
+_STATUS_ERR_QSS  = _STATUS_QSS % "#e74c3c"
+_STATUS_RUN_QSS  = _STATUS_QSS % "#d4d4d4"
+
+_LOG_BOX_QSS = (
+    "background-color: #1e1e1e; color: #d4d4d4;"
+    "border: 1px solid #444444; border-radius: 4px; padding: 6px;"
+)
+
+# Oldest lines are dropped past this many, so long output stays bounded.
+LOG_MAX_LINES = 2000
+
+BUTTON_QSS = "background-color: %s; color: white; font-size: 13px; border-radius: 6px;"
+
+
+# ─── Background job to run the command and stream output ──────────────────────
+# Lines are handed to the GUI thread once per read, in batches of at most
+# this many, to keep signal traffic low without holding any line back.
+BATCH_MAX_LINES = 32
+
+
+class CommandSignals(QObject):
+    output_ready = pyqtSignal(list)  # emitted with a batch of (line, kind) pairs
+    finished_ok  = pyqtSignal()      # emitted on success
+    finished_err = pyqtSignal(str)   # emitted on failure with error summary
+
+
+class CommandRunner(QRunnable):
+    """Runs one command on a pool thread and reports through ``signals``."""
+
+    def __init__(self, command, signals):
+        """``command`` is an argv list; it is executed without a shell."""
+        super().__init__()
+        self.command = command
+        self.signals = signals
+
+    def run(self):
+        signals = self.signals
+        try:
+            process = subprocess.Popen(
+                self.command,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,   # merge stderr → stdout so we see [#] lines
+                bufsize=-1
+            )
+
+            for lines in iter_output_batches(process.stdout):
+                # Classify on the raw bytes; decode only what gets shown.
+                batch = [
+                    (line.decode("utf-8", "replace"), classify_line(line))
+                    for line in lines
+                ]
+                for i in range(0, len(batch), BATCH_MAX_LINES):
+                    signals.output_ready.emit(batch[i:i + BATCH_MAX_LINES])
+
+            process.wait()
+            if process.returncode == 0:
+                signals.finished_ok.emit()
+            else:
+                signals.finished_err.emit(f"Exit code {process.returncode}")
+        except Exception as e:
+            signals.finished_err.emit(str(e))
+
+
+# ─── Shared window: title, status line, log box and command plumbing ──────────
+class WireGuardToggleBase(QWidget):
+    """Base window for the tunnel toggles.
+
+    Subclasses add their buttons in ``build_buttons`` and list the ones that
+    must be disabled while a command runs in ``self.command_buttons``.
+    """
+
+    BTN_UP_QSS   = BUTTON_QSS % "#27ae60"
+    BTN_DOWN_QSS = BUTTON_QSS % "#e74c3c"
+
+    def __init__(self, window_title, min_width):
+        super().__init__()
+        self.setWindowTitle(window_title)
+        self.setMinimumSize(min_width, 400)
+        self.command_buttons = []
+
+        layout = QVBoxLayout()
+        layout.setSpacing(12)
+        layout.setContentsMargins(25, 20, 25, 20)
+
+        # ── Title ──────────────────────────────────────────────────────────────
+        title = QLabel("WireGuard Tunnel Control")
+        title.setAlignment(Qt.AlignCenter)
+        title.setFont(_TITLE_FONT)
+        layout.addWidget(title)
+
+        # ── Buttons ────────────────────────────────────────────────────────────
+        self.build_buttons(layout)
+
+        # ── Status line ────────────────────────────────────────────────────────
+        self.status_label = QLabel("Status: –")
+        self.status_label.setAlignment(Qt.AlignCenter)
+        self.status_label.setWordWrap(True)
+        self.status_label.setFixedHeight(30)
+        self.status_label.setStyleSheet(_STATUS_IDLE_QSS)
+        self._status_qss = _STATUS_IDLE_QSS
+        layout.addWidget(self.status_label)
+
+        # ── Log output box ─────────────────────────────────────────────────────
+        self.log_box = QTextEdit()
+        self.log_box.setReadOnly(True)
+        self.log_box.setFont(_LOG_FONT)
+        self.log_box.setStyleSheet(_LOG_BOX_QSS)
+        self.log_box.setMinimumHeight(200)
+        self.log_box.document().setMaximumBlockCount(LOG_MAX_LINES)
+        layout.addWidget(self.log_box)
+
+        self.setLayout(layout)
+
+        # Commands run one at a time on a single long-lived pool thread, so a
+        # click does not pay for creating and tearing down a QThread.
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._pool.setExpiryTimeout(-1)
+        self._ok_msg = ""
+        self._err_prefix = ""
+        self._signals = CommandSignals(self)
+        self._signals.output_ready.connect(self.append_lines)
+        self._signals.finished_ok.connect(partial(self._on_done, True))
+        self._signals.finished_err.connect(partial(self._on_done, False))
+
+        # Log lines are buffered and flushed to the log box in one go, so a
+        # burst of output costs one document reflow instead of one per line.
+        self._log_buffer = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setInterval(50)
+        self._log_timer.timeout.connect(self._flush_log)
+
+    def build_buttons(self, layout):
+        """Add the window's buttons to ``layout``."""
+        raise NotImplementedError
+
+    # ── Helpers ────────────────────────────────────────────────────────────────
+    def set_status(self, ok, message):
+        """Show ``message``; ``ok`` is True/False when done, None while running."""
+        if ok is None:
+            qss = _STATUS_RUN_QSS
+        else:
+            qss = _STATUS_OK_QSS if ok else _STATUS_ERR_QSS
+        # setStyleSheet repolishes the label even when the sheet is unchanged
+        if qss is not self._status_qss:
+            self.status_label.setStyleSheet(qss)
+            self._status_qss = qss
+        self.status_label.setText(message)
+
+    def append_log(self, line, kind=LINE_DEFAULT):
+        """Append a line to the log box, colored by its LINE_* kind."""
+        self._log_buffer.append((line, _LINE_FORMATS[kind]))
+
+    def append_lines(self, lines):
+        """Append a batch of (line, kind) pairs received from the running command."""
+        for line, kind in lines:
+            self.append_log(line, kind)
+
+    def _flush_log(self):
+        """Write all buffered log lines to the log box at once."""
+        if not self._log_buffer:
+            return
+        cursor = self.log_box.textCursor()
+        cursor.movePosition(QTextCursor.End)
+        cursor.beginEditBlock()
+        for line, fmt in self._log_buffer:
+            if cursor.position() > 0:
+                cursor.insertBlock()
+            cursor.insertText(line, fmt)
+        cursor.endEditBlock()
+        self._log_buffer.clear()
+        # Auto-scroll to bottom
+        self.log_box.moveCursor(QTextCursor.End)
+
+    def set_buttons_enabled(self, enabled):
+        for button in self.command_buttons:
+            button.setEnabled(enabled)
+
+    def start_command(self, command, label):
+        """Clear log, show header, disable buttons, queue the command."""
+        self.log_box.clear()
+        self._log_buffer.clear()
+        self.append_log(f"$ {label}", LINE_HEADER)
+        self.set_status(None, f"⏳ Running {label}…")
+        self.set_buttons_enabled(False)
+
+        self._ok_msg = f"✅ {label} completed successfully"
+        self._err_prefix = f"❌ {label} failed: "
+        self._log_timer.start()
+        self._pool.start(CommandRunner(command, self._signals))
+
+    def _on_done(self, ok, err=""):
+        self._log_timer.stop()
+        self._flush_log()
+        self.set_status(ok, self._ok_msg if ok else self._err_prefix + err)
+        self.set_buttons_enabled(True)
+
+    # ── Button actions ─────────────────────────────────────────────────────────
+    def tunnel_up(self):
+        self.start_command(["sudo", "awg-quick", "up", "awg0"], "Tunnel UP")
+
+    def tunnel_down(self):
+        self.start_command(["sudo", "awg-quick", "down", "awg0"], "Tunnel DOWN")